@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Dict
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -34,7 +35,7 @@ async def run_compliance_check(payload: ComplianceInput) -> ComplianceResult:
         "blocklist": list(payload.config.compliance_blocklist),
         "profile": payload.profile,
     }
-    review = registry.llm.compliance_review(payload.resume_markdown, policy)
+    review = await asyncio.to_thread(registry.llm.compliance_review, payload.resume_markdown, policy)
     status = review.get("status", "approved")
     violations = review.get("violations", [])
     report = {"status": status, "violations": violations}
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Dict
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -33,7 +34,7 @@ async def run_critique(payload: CritiqueInput) -> CritiqueResult:
     if not payload.resume_markdown or not payload.profile:
         raise ValueError("draft_resume and profile required before critique")
     registry = get_registry()
-    critique = registry.llm.critique_resume(payload.resume_markdown, payload.profile)
+    critique = await asyncio.to_thread(registry.llm.critique_resume, payload.resume_markdown, payload.profile)
     needs_revision = bool(critique.get("needs_revision")) and payload.revision_count < payload.config.max_revision_loops
     revision_total = payload.revision_count + 1 if needs_revision else payload.revision_count
     metrics = {"revisions": float(revision_total)} if needs_revision else {}
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Dict, List
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -53,7 +54,7 @@ async def plan_resume(payload: PlanResumeInput) -> PlanResumeResult:
     knowledge_hits: List[VectorSearchResult] = (
         registry.vector_store.similarity_search(target) if target else []
     )
-    llm_plan = registry.llm.plan_resume(profile, knowledge_hits)
+    llm_plan = await asyncio.to_thread(registry.llm.plan_resume, profile, knowledge_hits)
     drafted_plan = {
         "profile_name": profile.get("name", "Candidate"),
         "headline": profile.get("headline", target or "Professional"),
@@ -76,7 +77,9 @@ async def render_resume(payload: RenderResumeInput) -> RenderResumeResult:
     if not payload.plan or not payload.profile:
         raise ValueError("draft_plan and profile required before rendering")
     registry = get_registry()
-    resume_text = registry.llm.draft_resume(payload.plan, payload.profile, payload.knowledge_hits)
+    resume_text = await asyncio.to_thread(
+        registry.llm.draft_resume, payload.plan, payload.profile, payload.knowledge_hits
+    )
     message = ResumeMessage(role="assistant", content=resume_text, model=payload.config.default_model)
     next_draft_total = payload.previous_drafts + 1.0
     metrics = {"drafts": next_draft_total}
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Dict
 
 from pydantic import BaseModel, Field
@@ -40,7 +41,7 @@ async def normalize_documents(payload: NormalizeDocumentsInput) -> NormalizeDocu
         raise ToolInvocationError("raw_documents missing from ingestion payload")
     registry = get_registry()
     try:
-        llm_result = registry.llm.ingest_documents(documents)
+        llm_result = await asyncio.to_thread(registry.llm.ingest_documents, documents)
     except ToolInvocationError:
         raise
     except Exception as exc:  # pragma: no cover - defensive guard around arbitrary tools
@@ -49,9 +50,9 @@ async def normalize_documents(payload: NormalizeDocumentsInput) -> NormalizeDocu
     llm_documents = llm_result.get("normalized_documents", {}) if isinstance(llm_result, dict) else {}
     metadata = llm_result.get("metadata", {}) if isinstance(llm_result, dict) else {}
     normalized = {
-        key: " ".join(value.strip().split())
+        key: collapsed
         for key, value in llm_documents.items()
-        if isinstance(value, str) and value.strip()
+        if isinstance(value, str) and (collapsed := " ".join(value.split()))
     }
     if not normalized:
         raise ToolInvocationError("No documents contained usable content after normalization")
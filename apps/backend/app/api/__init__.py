@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import os
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, Depends, FastAPI, HTTPException, status
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request, status
+from fastapi.responses import FileResponse, JSONResponse
 from pydantic import BaseModel, ConfigDict, Field
-from temporalio.client import Client, WorkflowHandle
+from temporalio.client import Client, WorkflowFailureError, WorkflowHandle
 from temporalio.common import WorkflowIDReusePolicy
+from temporalio.exceptions import ActivityError, ApplicationError
+from temporalio.service import RPCError, RPCStatusCode
 
 from .. import (
     TASK_QUEUE,
@@ -30,6 +33,8 @@ FRONTEND_DIST_DIR = Path(
     )
 )
 
+logger = logging.getLogger(__name__)
+
 
 class StartWorkflowRequest(BaseModel):
     task: TaskType = "resume_pipeline"
@@ -64,6 +69,36 @@ class WorkflowResultResponse(BaseModel):
     state: ResumeWorkflowState
 
 
+class PipelineErrorResponse(BaseModel):
+    detail: str
+    workflow_id: str
+    failed_activity: Optional[str] = None
+
+
+class PipelineError(Exception):
+    """Raised when a resume workflow finishes without producing a result."""
+
+    def __init__(self, workflow_id: str, failed_activity: Optional[str], reason: str) -> None:
+        activity = f" during {failed_activity}" if failed_activity else ""
+        super().__init__(f"Resume workflow failed{activity}: {reason}")
+        self.workflow_id = workflow_id
+        self.failed_activity = failed_activity
+
+
+def _failed_activity(exc: WorkflowFailureError) -> Optional[str]:
+    if isinstance(exc.cause, ActivityError):
+        return exc.cause.activity_type
+    return None
+
+
+def _failure_reason(exc: WorkflowFailureError) -> str:
+    # Only the activity's own ApplicationError message is client-facing; anything
+    # chained beneath it may carry raw provider errors and is left to the log.
+    if isinstance(exc.cause, ActivityError) and isinstance(exc.cause.cause, ApplicationError):
+        return exc.cause.cause.message
+    return str(exc)
+
+
 _client_lock = asyncio.Lock()
 _cached_client: Client | None = None
 
@@ -140,13 +175,21 @@ async def submit_human_approval(
     )
 
 
-@router.get("/workflows/{workflow_id}/result", response_model=WorkflowResultResponse)
+@router.get(
+    "/workflows/{workflow_id}/result",
+    response_model=WorkflowResultResponse,
+    responses={status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": PipelineErrorResponse}},
+)
 async def get_workflow_result(workflow_id: str, client: Client = Depends(get_temporal_client)) -> WorkflowResultResponse:
     handle = await get_workflow_handle(workflow_id, client)
     try:
         state = await handle.result()
-    except Exception as exc:  # pragma: no cover - propagate failure reason
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)) from exc
+    except WorkflowFailureError as exc:
+        raise PipelineError(workflow_id, _failed_activity(exc), _failure_reason(exc)) from exc
+    except RPCError as exc:
+        if exc.status == RPCStatusCode.NOT_FOUND:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+        raise
     return WorkflowResultResponse(state=state)
 
 
@@ -156,9 +199,14 @@ def _index_path() -> Path | None:
     return index if index.exists() else None
 
 
+@lru_cache(maxsize=1)
+def _resolved_dist_dir() -> Path:
+    return FRONTEND_DIST_DIR.resolve()
+
+
 def _is_safe_static_path(candidate: Path) -> bool:
     try:
-        candidate.resolve().relative_to(FRONTEND_DIST_DIR.resolve())
+        candidate.resolve().relative_to(_resolved_dist_dir())
     except (ValueError, FileNotFoundError):
         return False
     return candidate.is_file()
@@ -167,6 +215,27 @@ def _is_safe_static_path(candidate: Path) -> bool:
 app.include_router(router)
 
 
+@app.exception_handler(PipelineError)
+async def handle_pipeline_error(_request: Request, exc: PipelineError) -> JSONResponse:
+    cause = exc.__cause__
+    logger.error(
+        "%s (workflow_id=%s, error_type=%s)",
+        exc,
+        exc.workflow_id,
+        type(cause).__name__,
+        exc_info=cause,
+    )
+    body = PipelineErrorResponse(
+        detail=str(exc),
+        workflow_id=exc.workflow_id,
+        failed_activity=exc.failed_activity,
+    )
+    return JSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content=body.model_dump(),
+    )
+
+
 @app.get("/", include_in_schema=False)
 async def serve_frontend_root() -> FileResponse:
     index = _index_path()
@@ -187,4 +256,4 @@ async def serve_frontend_spa(resource_path: str) -> FileResponse:
     return FileResponse(index)
 
 
-__all__ = ["app", "get_temporal_client"]
+__all__ = ["PipelineError", "PipelineErrorResponse", "app", "get_temporal_client"]
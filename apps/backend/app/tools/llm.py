@@ -85,9 +85,10 @@ DRAFT_USER_PROMPT = (
 CRITIQUE_SYSTEM_PROMPT = (
     "You review resumes for quality issues. Return JSON with keys 'needs_revision' (boolean) and 'issues' (list of strings)."
 )
+# Stable context leads each user prompt so provider prefix caching survives revision loops.
 CRITIQUE_USER_PROMPT = (
-    "Resume markdown:```\n{resume_text}\n```\n"
     "Candidate profile: {profile_json}\n"
+    "Resume markdown:```\n{resume_text}\n```\n"
     "Identify gaps, placeholders, or missing impact. If the resume is acceptable, return needs_revision=false with an empty issues list."
 )
 
@@ -95,8 +96,8 @@ COMPLIANCE_SYSTEM_PROMPT = (
     "You enforce compliance and redaction policies. Respond with JSON containing 'status' ('approved' or 'rejected') and 'violations' (list of strings)."
 )
 COMPLIANCE_USER_PROMPT = (
-    "Resume markdown:```\n{resume_text}\n```\n"
     "Policy guidance: {policy_json}\n"
+    "Resume markdown:```\n{resume_text}\n```\n"
     "If any policy rule is violated, set status to 'rejected' and list the violations."
 )
 
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Sequence
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+_EXPERIENCE_DEFAULTS: Tuple[Tuple[str, str], ...] = (
+    ("role", "Role Unknown"),
+    ("company", "Company Unknown"),
+    ("impact", "Impact pending"),
+)
 
 
 @dataclass(slots=True)
@@ -42,13 +48,7 @@ class ResumeRendererTool:
         if isinstance(value, Iterable):
             for item in value:
                 if isinstance(item, dict):
-                    results.append(
-                        {
-                            "role": str(item.get("role", "Role Unknown")),
-                            "company": str(item.get("company", "Company Unknown")),
-                            "impact": str(item.get("impact", "Impact pending")),
-                        }
-                    )
+                    results.append({key: str(item.get(key, default)) for key, default in _EXPERIENCE_DEFAULTS})
         return results
 
     @staticmethod
@@ -58,12 +58,7 @@ class ResumeRendererTool:
 
     @staticmethod
     def _format_experience(experiences: Sequence[Dict[str, str]]) -> str:
-        blocks: List[str] = []
-        for exp in experiences:
-            role = exp.get("role", "Role Unknown")
-            company = exp.get("company", "Company Unknown")
-            impact = exp.get("impact", "Impact pending")
-            blocks.append(f"- **{role}**, {company}: {impact}")
+        blocks = [f"- **{exp['role']}**, {exp['company']}: {exp['impact']}" for exp in experiences]
         return "\n".join(blocks) if blocks else "- Experience pending collection"
 
 
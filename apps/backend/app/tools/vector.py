@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Tuple, TypedDict
+from typing import Dict, FrozenSet, List, Tuple, TypedDict
 
 
 class VectorSearchResult(TypedDict):
@@ -19,6 +19,7 @@ class VectorSearchTool:
         "Token overlap search over previously ingested documents; deterministic and idempotent."
     )
     _documents: Dict[str, str] = field(default_factory=dict)
+    _token_sets: Dict[str, FrozenSet[str]] = field(default_factory=dict)
 
     def upsert(self, documents: Dict[str, str]) -> Dict[str, int]:
         """Insert or update documents in the in-memory index."""
@@ -28,6 +29,7 @@ class VectorSearchTool:
             existing = self._documents.get(key)
             if existing != value:
                 self._documents[key] = value
+                self._token_sets[key] = self._tokenize(value)
                 updated += 1
         return {"upserted": updated, "count": len(self._documents)}
 
@@ -37,11 +39,11 @@ class VectorSearchTool:
         if not self._documents:
             return []
 
-        tokens = self._tokenize(query)
+        query_tokens = self._tokenize(query)
         scored: List[Tuple[float, str, str]] = []
         result: List[VectorSearchResult] = []
         for doc_id, content in self._documents.items():
-            overlap = self._overlap(tokens, self._tokenize(content))
+            overlap = self._overlap(query_tokens, self._token_sets[doc_id])
             if overlap > 0:
                 scored.append((overlap, doc_id, content))
         scored.sort(reverse=True)
@@ -57,17 +59,15 @@ class VectorSearchTool:
         return result
 
     @staticmethod
-    def _tokenize(text: str) -> List[str]:
-        return [token for token in text.lower().split() if token]
+    def _tokenize(text: str) -> FrozenSet[str]:
+        return frozenset(text.lower().split())
 
     @staticmethod
-    def _overlap(query_tokens: Iterable[str], doc_tokens: Iterable[str]) -> float:
-        query_set = set(query_tokens)
-        doc_set = set(doc_tokens)
-        if not query_set or not doc_set:
+    def _overlap(query_tokens: FrozenSet[str], doc_tokens: FrozenSet[str]) -> float:
+        if not query_tokens or not doc_tokens:
             return 0.0
-        shared = len(query_set & doc_set)
-        return shared / float(len(query_set))
+        shared = len(query_tokens & doc_tokens)
+        return shared / float(len(query_tokens))
 
 
 __all__ = ["VectorSearchTool"]
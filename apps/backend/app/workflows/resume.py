@@ -10,17 +10,24 @@ from ..state import AgentConfig, PipelineStage, ResumeWorkflowState
 
 TASK_QUEUE = "resume-assistant"
 
+_SCHEDULE_TO_CLOSE = timedelta(seconds=30)
+_START_TO_CLOSE = timedelta(seconds=20)
+_RENDER_SCHEDULE_TO_CLOSE = timedelta(seconds=60)
+_RENDER_START_TO_CLOSE = timedelta(seconds=45)
+
+
+_INITIAL_STAGES: Dict[Optional[str], PipelineStage] = {
+    "ingest": "ingestion",
+    "draft": "drafting",
+    "revise": "drafting",
+    "resume_pipeline": "ingestion",
+    "compliance_only": "compliance",
+    "publish": "publishing",
+}
+
 
 def _initial_stage(task: Optional[str]) -> PipelineStage:
-    mapping: Dict[Optional[str], PipelineStage] = {
-        "ingest": "ingestion",
-        "draft": "drafting",
-        "revise": "drafting",
-        "resume_pipeline": "ingestion",
-        "compliance_only": "compliance",
-        "publish": "publishing",
-    }
-    return mapping.get(task, "ingestion")
+    return _INITIAL_STAGES.get(task, "ingestion")
 
 
 @workflow.defn
@@ -85,8 +92,10 @@ class ResumeWorkflow:
     def current_state(self) -> ResumeWorkflowState:
         if self.state is None:  # pragma: no cover - defensive guard
             raise RuntimeError("Workflow state not initialized")
-        # Return a copy to avoid accidental mutation during replay
-        return self.state.model_copy(deep=True)
+        # Returning live state is safe only because the SDK converts the query result to
+        # payloads right after handle_query returns. This holds as long as no inbound
+        # interceptor yields between the two.
+        return self.state
 
     async def _run_ingestion(self) -> None:
         assert self.state is not None
@@ -94,8 +103,8 @@ class ResumeWorkflow:
         normalize_result = await workflow.execute_activity(
             ingestion.normalize_documents,
             ingestion.NormalizeDocumentsInput(raw_documents=raw_documents),
-            schedule_to_close_timeout=timedelta(seconds=30),
-            start_to_close_timeout=timedelta(seconds=20),
+            schedule_to_close_timeout=_SCHEDULE_TO_CLOSE,
+            start_to_close_timeout=_START_TO_CLOSE,
             task_queue=TASK_QUEUE,
         )
         self._apply_audit(normalize_result.audit_event)
@@ -110,8 +119,8 @@ class ResumeWorkflow:
                 normalized_documents=normalize_result.normalized_documents,
                 request_id=self.state.request_id,
             ),
-            schedule_to_close_timeout=timedelta(seconds=30),
-            start_to_close_timeout=timedelta(seconds=20),
+            schedule_to_close_timeout=_SCHEDULE_TO_CLOSE,
+            start_to_close_timeout=_START_TO_CLOSE,
             task_queue=TASK_QUEUE,
         )
         self._apply_audit(index_result.audit_event)
@@ -143,8 +152,8 @@ class ResumeWorkflow:
                     revision_count=revision_count,
                     config=self.config,
                 ),
-                schedule_to_close_timeout=timedelta(seconds=30),
-                start_to_close_timeout=timedelta(seconds=20),
+                schedule_to_close_timeout=_SCHEDULE_TO_CLOSE,
+                start_to_close_timeout=_START_TO_CLOSE,
                 task_queue=TASK_QUEUE,
             )
             self._apply_audit(critique_result.audit_event)
@@ -167,8 +176,8 @@ class ResumeWorkflow:
                 request_id=self.state.request_id,
                 config=self.config,
             ),
-            schedule_to_close_timeout=timedelta(seconds=30),
-            start_to_close_timeout=timedelta(seconds=20),
+            schedule_to_close_timeout=_SCHEDULE_TO_CLOSE,
+            start_to_close_timeout=_START_TO_CLOSE,
             task_queue=TASK_QUEUE,
         )
         self._apply_audit(plan_result.audit_event)
@@ -184,8 +193,8 @@ class ResumeWorkflow:
                 config=self.config,
                 previous_drafts=float(self.state.metrics.get("drafts", 0.0)),
             ),
-            schedule_to_close_timeout=timedelta(seconds=60),
-            start_to_close_timeout=timedelta(seconds=45),
+            schedule_to_close_timeout=_RENDER_SCHEDULE_TO_CLOSE,
+            start_to_close_timeout=_RENDER_START_TO_CLOSE,
             task_queue=TASK_QUEUE,
         )
         self._apply_audit(render_result.audit_event)
@@ -204,8 +213,8 @@ class ResumeWorkflow:
                 profile=self.state.artifacts.get("profile", {}),
                 config=self.config,
             ),
-            schedule_to_close_timeout=timedelta(seconds=30),
-            start_to_close_timeout=timedelta(seconds=20),
+            schedule_to_close_timeout=_SCHEDULE_TO_CLOSE,
+            start_to_close_timeout=_START_TO_CLOSE,
             task_queue=TASK_QUEUE,
         )
         self._apply_audit(compliance_result.audit_event)
@@ -239,8 +248,8 @@ class ResumeWorkflow:
                 resume_markdown=self.state.artifacts.get("draft_resume", ""),
                 request_id=self.state.request_id,
             ),
-            schedule_to_close_timeout=timedelta(seconds=30),
-            start_to_close_timeout=timedelta(seconds=20),
+            schedule_to_close_timeout=_SCHEDULE_TO_CLOSE,
+            start_to_close_timeout=_START_TO_CLOSE,
             task_queue=TASK_QUEUE,
         )
         self._apply_audit(persist_result.audit_event)
@@ -249,8 +258,8 @@ class ResumeWorkflow:
         notify_result = await workflow.execute_activity(
             publishing.notify_operations,
             publishing.NotifyInput(request_id=self.state.request_id),
-            schedule_to_close_timeout=timedelta(seconds=30),
-            start_to_close_timeout=timedelta(seconds=20),
+            schedule_to_close_timeout=_SCHEDULE_TO_CLOSE,
+            start_to_close_timeout=_START_TO_CLOSE,
             task_queue=TASK_QUEUE,
         )
         self._apply_audit(notify_result.audit_event)
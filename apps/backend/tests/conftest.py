@@ -0,0 +1,11 @@
+import pytest
+from temporalio.testing import WorkflowEnvironment
+
+
+@pytest.fixture(scope="session")
+async def workflow_env():
+    env = await WorkflowEnvironment.start_time_skipping()
+    try:
+        yield env
+    finally:
+        await env.shutdown()
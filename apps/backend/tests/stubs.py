@@ -3,6 +3,14 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, List
 
+from app.tools import (
+    NotificationTool,
+    PublishingCacheTool,
+    ResumeRendererTool,
+    ToolRegistry,
+    VectorSearchTool,
+)
+
 
 @dataclass
 class StubResumeLLM:
@@ -71,3 +79,15 @@ class StubResumeLLM:
             for key, cleaned_value in cleaned.items()
         }
         return {"normalized_documents": cleaned, "metadata": metadata}
+
+
+def build_stub_registry(*, required_revisions: int = 0) -> ToolRegistry:
+    """Assemble a registry of in-memory tools backed by the stub LLM."""
+
+    return ToolRegistry(
+        vector_store=VectorSearchTool(),
+        renderer=ResumeRendererTool(),
+        cache=PublishingCacheTool(),
+        notifications=NotificationTool(),
+        llm=StubResumeLLM(required_revisions=required_revisions),
+    )
@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 
 from app.activities import configure_registry
@@ -22,30 +24,16 @@ from app.activities.publishing import (
     persist_resume,
 )
 from app.state import AgentConfig
-from app.tools import (
-    NotificationTool,
-    PublishingCacheTool,
-    ResumeRendererTool,
-    ToolRegistry,
-    VectorSearchTool,
-)
-from tests.stubs import StubResumeLLM
+from tests.stubs import build_stub_registry
 
 
 @pytest.fixture(autouse=True)
 def configure_stub_registry():
-    registry = ToolRegistry(
-        vector_store=VectorSearchTool(),
-        renderer=ResumeRendererTool(),
-        cache=PublishingCacheTool(),
-        notifications=NotificationTool(),
-        llm=StubResumeLLM(required_revisions=1),
-    )
+    registry = build_stub_registry(required_revisions=1)
     configure_registry(registry)
     return registry
 
 
-@pytest.mark.asyncio
 async def test_ingestion_flow(configure_stub_registry):
     normalize_result = await normalize_documents(
         NormalizeDocumentsInput(raw_documents={"resume": " First  value ", "job": " value"})
@@ -64,7 +52,6 @@ async def test_ingestion_flow(configure_stub_registry):
     assert index_result.metrics == {"indexed": 2.0}
 
 
-@pytest.mark.asyncio
 async def test_drafting_and_render(configure_stub_registry):
     await normalize_documents(NormalizeDocumentsInput(raw_documents={"resume": "engineer"}))
     await index_documents(
@@ -90,7 +77,6 @@ async def test_drafting_and_render(configure_stub_registry):
     assert render.metrics["drafts"] == 1.0
 
 
-@pytest.mark.asyncio
 async def test_critique_requests_revision(configure_stub_registry):
     result = await run_critique(
         CritiqueInput(
@@ -104,7 +90,6 @@ async def test_critique_requests_revision(configure_stub_registry):
     assert result.revision_count == 1
 
 
-@pytest.mark.asyncio
 async def test_compliance_allows_resume(configure_stub_registry):
     result = await run_compliance_check(
         ComplianceInput(
@@ -116,7 +101,46 @@ async def test_compliance_allows_resume(configure_stub_registry):
     assert result.status == "approved"
 
 
-@pytest.mark.asyncio
+async def test_llm_calls_run_off_the_event_loop_thread(configure_stub_registry, monkeypatch):
+    llm = configure_stub_registry.llm
+    call_threads = {}
+    for name in ("ingest_documents", "plan_resume", "draft_resume", "critique_resume", "compliance_review"):
+
+        def record(*args, _name=name, _method=getattr(llm, name)):
+            call_threads[_name] = threading.get_ident()
+            return _method(*args)
+
+        monkeypatch.setattr(llm, name, record)
+
+    profile = {"name": "Case", "headline": "Developer", "target_role": "engineer"}
+    await normalize_documents(NormalizeDocumentsInput(raw_documents={"resume": "engineer"}))
+    plan = await plan_resume(PlanResumeInput(profile=profile, request_id="req-1", config=AgentConfig()))
+    render = await render_resume(
+        RenderResumeInput(
+            plan=plan.draft_plan,
+            profile=profile,
+            knowledge_hits=plan.knowledge_hits,
+            config=AgentConfig(),
+            previous_drafts=0.0,
+        )
+    )
+    await run_critique(
+        CritiqueInput(resume_markdown=render.resume_markdown, profile=profile, revision_count=0, config=AgentConfig())
+    )
+    await run_compliance_check(
+        ComplianceInput(resume_markdown=render.resume_markdown, profile=profile, config=AgentConfig())
+    )
+
+    assert call_threads.keys() == {
+        "ingest_documents",
+        "plan_resume",
+        "draft_resume",
+        "critique_resume",
+        "compliance_review",
+    }
+    assert threading.get_ident() not in call_threads.values()
+
+
 async def test_publishing_persists_and_notifies(configure_stub_registry):
     persist = await persist_resume(
         PersistResumeInput(resume_markdown="content", request_id="abc")
@@ -1,7 +1,22 @@
+import logging
+from pathlib import Path
+from urllib.parse import quote
+
 import pytest
 from httpx import ASGITransport, AsyncClient
-
-from app.api import app, get_temporal_client
+from temporalio.client import WorkflowFailureError
+from temporalio.exceptions import ActivityError, ApplicationError, RetryState
+from temporalio.service import RPCError, RPCStatusCode
+
+import app.api as api_module
+from app.api import (
+    PipelineErrorResponse,
+    StartWorkflowResponse,
+    WorkflowResultResponse,
+    WorkflowStateResponse,
+    app,
+    get_temporal_client,
+)
 from app.state import initialize_state
 
 
@@ -11,6 +26,7 @@ class DummyHandle:
         self.run_id = "run-001"
         self._state = state
         self.signals = []
+        self.failure = None
 
     async def query(self, _method):
         return self._state
@@ -23,6 +39,8 @@ class DummyHandle:
         self.signals.append((bool(approved), notes))
 
     async def result(self):
+        if self.failure is not None:
+            raise self.failure
         return self._state
 
 
@@ -41,9 +59,14 @@ class DummyClient:
             raise RuntimeError("unknown workflow")
         return self.handle
 
+    def reset(self):
+        self.started_with = None
+        self.handle.signals.clear()
+        self.handle.failure = None
+
 
-@pytest.fixture
-async def api_client():
+@pytest.fixture(scope="module")
+async def shared_api_client():
     state = initialize_state(task="resume_pipeline", request_id="req-123")
     dummy_client = DummyClient(state)
 
@@ -57,17 +80,41 @@ async def api_client():
     app.dependency_overrides.clear()
 
 
-@pytest.mark.asyncio
+@pytest.fixture
+def api_client(shared_api_client):
+    client, dummy_client = shared_api_client
+    dummy_client.reset()
+    return client, dummy_client
+
+
+def _clear_frontend_caches():
+    api_module._index_path.cache_clear()
+    api_module._resolved_dist_dir.cache_clear()
+
+
+@pytest.fixture
+def frontend_dist(tmp_path, monkeypatch):
+    dist = tmp_path / "dist"
+    (dist / "assets").mkdir(parents=True)
+    (dist / "index.html").write_text("<html>index</html>")
+    (dist / "assets" / "app.js").write_text("console.log('app');")
+    (tmp_path / "secret.txt").write_text("secret")
+    (dist / "assets" / "leak.txt").symlink_to(tmp_path / "secret.txt")
+    monkeypatch.setattr(api_module, "FRONTEND_DIST_DIR", dist)
+    _clear_frontend_caches()
+    yield dist
+    _clear_frontend_caches()
+
+
 async def test_start_workflow(api_client):
     client, dummy = api_client
     response = await client.post("/api/workflows/resume", json={"task": "resume_pipeline", "request_id": "req-123"})
     assert response.status_code == 200
-    payload = response.json()
-    assert payload["workflow_id"] == "req-123"
+    payload = StartWorkflowResponse.model_validate_json(response.content)
+    assert payload.workflow_id == "req-123"
     assert dummy.started_with is not None
 
 
-@pytest.mark.asyncio
 async def test_health_check(api_client):
     client, _dummy = api_client
     response = await client.get("/api/health")
@@ -75,26 +122,127 @@ async def test_health_check(api_client):
     assert response.json() == {"status": "ok"}
 
 
-@pytest.mark.asyncio
 async def test_get_workflow_state(api_client):
     client, _dummy = api_client
     response = await client.get("/api/workflows/req-123")
     assert response.status_code == 200
-    state = response.json()["state"]
-    assert state["request_id"] == "req-123"
+    payload = WorkflowStateResponse.model_validate_json(response.content)
+    assert payload.state.request_id == "req-123"
 
 
-@pytest.mark.asyncio
-async def test_submit_approval(api_client):
+@pytest.mark.parametrize(
+    ("approved", "notes"),
+    [(True, "ok"), (False, "Needs stronger impact statements"), (True, None)],
+    ids=["approved", "rejected", "approved_without_notes"],
+)
+async def test_submit_approval(api_client, approved, notes):
     client, dummy = api_client
-    response = await client.post("/api/workflows/req-123/approval", json={"approved": True, "notes": "ok"})
+    response = await client.post("/api/workflows/req-123/approval", json={"approved": approved, "notes": notes})
     assert response.status_code == 202
-    assert dummy.handle.signals == [(True, "ok")]
+    assert dummy.handle.signals == [(approved, notes)]
 
 
-@pytest.mark.asyncio
 async def test_get_result(api_client):
     client, _dummy = api_client
     response = await client.get("/api/workflows/req-123/result")
     assert response.status_code == 200
-    assert response.json()["state"]["status"] == "pending"
+    payload = WorkflowResultResponse.model_validate_json(response.content)
+    assert payload.state.status == "pending"
+
+
+async def test_get_result_reports_pipeline_failure(api_client):
+    client, dummy = api_client
+    dummy.handle.failure = WorkflowFailureError(cause=RuntimeError("No documents contained usable content"))
+    response = await client.get("/api/workflows/req-123/result")
+    assert response.status_code == 500
+    assert response.json() == {
+        "detail": "Resume workflow failed: Workflow execution failed",
+        "workflow_id": "req-123",
+        "failed_activity": None,
+    }
+
+
+async def test_get_result_reports_failed_activity(api_client, caplog):
+    client, dummy = api_client
+    activity_error = ActivityError(
+        "Activity task failed",
+        scheduled_event_id=5,
+        started_event_id=6,
+        identity="worker-1",
+        activity_type="run_critique",
+        activity_id="3",
+        retry_state=RetryState.MAXIMUM_ATTEMPTS_REACHED,
+    )
+    application_error = ApplicationError("Critique model returned no feedback")
+    application_error.__cause__ = RuntimeError("Error code: 401 - Incorrect API key provided: sk-proj-****abcd")
+    activity_error.__cause__ = application_error
+    dummy.handle.failure = WorkflowFailureError(cause=activity_error)
+
+    with caplog.at_level(logging.ERROR, logger="app.api"):
+        response = await client.get("/api/workflows/req-123/result")
+
+    assert response.status_code == 500
+    assert "Incorrect API key" not in response.text
+    payload = PipelineErrorResponse.model_validate_json(response.content)
+    assert payload.detail == "Resume workflow failed during run_critique: Critique model returned no feedback"
+    assert payload.workflow_id == "req-123"
+    assert payload.failed_activity == "run_critique"
+    (record,) = caplog.records
+    assert "Critique model returned no feedback" in record.getMessage()
+    assert record.exc_info is not None and record.exc_info[1] is dummy.handle.failure
+    assert "Incorrect API key" in caplog.text
+
+
+async def test_get_result_maps_unknown_workflow_to_not_found(api_client):
+    client, dummy = api_client
+    dummy.handle.failure = RPCError("workflow not found", RPCStatusCode.NOT_FOUND, b"")
+    response = await client.get("/api/workflows/req-123/result")
+    assert response.status_code == 404
+    assert response.json() == {"detail": "workflow not found"}
+
+
+async def test_get_result_propagates_other_rpc_errors(api_client):
+    client, dummy = api_client
+    dummy.handle.failure = RPCError("connection lost", RPCStatusCode.UNAVAILABLE, b"")
+    with pytest.raises(RPCError):
+        await client.get("/api/workflows/req-123/result")
+
+
+async def test_frontend_serves_bundle_asset(api_client, frontend_dist):
+    client, _dummy = api_client
+    response = await client.get("/assets/app.js")
+    assert response.status_code == 200
+    assert response.text == "console.log('app');"
+
+
+async def test_frontend_serves_assets_from_relative_dist_dir(api_client, frontend_dist, monkeypatch):
+    client, _dummy = api_client
+    monkeypatch.chdir(frontend_dist)
+    monkeypatch.setattr(api_module, "FRONTEND_DIST_DIR", Path("."))
+    _clear_frontend_caches()
+
+    response = await client.get("/assets/app.js")
+    assert response.text == "console.log('app');"
+
+    response = await client.get("/%2e%2e/secret.txt")
+    assert response.text == "<html>index</html>"
+
+
+@pytest.mark.parametrize(
+    "resource",
+    ["%2e%2e/secret.txt", "assets/%2e%2e/%2e%2e/secret.txt", "assets/leak.txt"],
+    ids=["parent_dir", "nested_parent_dir", "symlink_outside_bundle"],
+)
+async def test_frontend_falls_back_to_index_outside_bundle(api_client, frontend_dist, resource):
+    client, _dummy = api_client
+    response = await client.get("/" + resource)
+    assert response.status_code == 200
+    assert response.text == "<html>index</html>"
+
+
+async def test_frontend_falls_back_to_index_for_absolute_path(api_client, frontend_dist):
+    client, _dummy = api_client
+    secret = quote(str(frontend_dist.parent / "secret.txt"), safe="")
+    response = await client.get("/" + secret)
+    assert response.status_code == 200
+    assert response.text == "<html>index</html>"
@@ -3,29 +3,12 @@ from __future__ import annotations
 import pytest
 from pydantic import ValidationError
 
-from app.tools import (
-    NotificationTool,
-    PublishingCacheTool,
-    ResumeRendererTool,
-    ToolRegistry,
-    VectorSearchTool,
-)
 from app.tools.llm import DraftResponse, PlanResponse
-from tests.stubs import StubResumeLLM
-
-
-def build_registry() -> ToolRegistry:
-    return ToolRegistry(
-        vector_store=VectorSearchTool(),
-        renderer=ResumeRendererTool(),
-        cache=PublishingCacheTool(),
-        notifications=NotificationTool(),
-        llm=StubResumeLLM(),
-    )
+from tests.stubs import build_stub_registry
 
 
 def test_vector_search_upsert_and_similarity():
-    registry = build_registry()
+    registry = build_stub_registry()
     registry.vector_store.upsert({"doc1": "Python developer with API experience"})
     registry.vector_store.upsert({"doc2": "Project manager with agile delivery"})
 
@@ -34,8 +17,17 @@ def test_vector_search_upsert_and_similarity():
     assert results[0]["id"] == "doc1"
 
 
+def test_vector_search_reflects_updated_documents():
+    registry = build_stub_registry()
+    registry.vector_store.upsert({"doc1": "Python developer"})
+    registry.vector_store.upsert({"doc1": "Golang developer"})
+
+    assert registry.vector_store.similarity_search("Python") == []
+    assert registry.vector_store.similarity_search("golang")[0]["id"] == "doc1"
+
+
 def test_resume_renderer_formats_sections():
-    registry = build_registry()
+    registry = build_stub_registry()
     resume = registry.renderer.render(
         {
             "name": "Ada Lovelace",
@@ -53,7 +45,7 @@ def test_resume_renderer_formats_sections():
 
 
 def test_publishing_cache_store_and_fetch():
-    registry = build_registry()
+    registry = build_stub_registry()
     saved = registry.cache.store("req-1", resume="resume text", checksum="abc123")
     assert saved == {"resume": "resume text", "checksum": "abc123"}
     saved["resume"] = "mutated"
@@ -66,7 +58,7 @@ def test_publishing_cache_store_and_fetch():
 
 
 def test_notification_tool_collects_events():
-    registry = build_registry()
+    registry = build_stub_registry()
     registry.notifications.publish({"status": "delivered", "recipient": "qa", "message": "All done"})
     events = registry.notifications.events
     assert events == [
@@ -0,0 +1,18 @@
+import sys
+
+import pytest
+
+import worker
+
+
+def test_loop_factory_falls_back_without_uvloop(monkeypatch):
+    # A None entry in sys.modules makes ``import uvloop`` raise ImportError
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    assert worker._loop_factory() is None
+
+
+def test_loop_factory_prefers_uvloop():
+    uvloop = pytest.importorskip("uvloop")
+
+    assert worker._loop_factory() is uvloop.new_event_loop
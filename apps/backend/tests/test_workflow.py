@@ -1,6 +1,5 @@
 import pytest
 from temporalio import worker
-from temporalio.testing import WorkflowEnvironment
 from temporalio.worker.workflow_sandbox import (
     SandboxedWorkflowRunner,
     SandboxRestrictions,
@@ -14,26 +13,16 @@ from app import (
     initialize_state,
     list_all_activities,
 )
-from app.tools import (
-    NotificationTool,
-    PublishingCacheTool,
-    ResumeRendererTool,
-    ToolRegistry,
-    VectorSearchTool,
-)
-from tests.stubs import StubResumeLLM
+from tests.stubs import build_stub_registry
 
 
-@pytest.mark.asyncio
-async def test_resume_workflow_completes():
-    registry = ToolRegistry(
-        vector_store=VectorSearchTool(),
-        renderer=ResumeRendererTool(),
-        cache=PublishingCacheTool(),
-        notifications=NotificationTool(),
-        llm=StubResumeLLM(required_revisions=1),
-    )
-    configure_registry(registry)
+@pytest.mark.parametrize(
+    ("required_revisions", "max_revision_loops"),
+    [(1, 2), (0, 0)],
+    ids=["with_revision", "without_revision"],
+)
+async def test_resume_workflow_completes(workflow_env, required_revisions, max_revision_loops):
+    configure_registry(build_stub_registry(required_revisions=required_revisions))
 
     state = initialize_state(
         task="resume_pipeline",
@@ -51,33 +40,26 @@ async def test_resume_workflow_completes():
         },
     )
 
-    env = await WorkflowEnvironment.start_time_skipping()
-    result = None
-    try:
-        activities = list_all_activities()
-        async with worker.Worker(
-            env.client,
+    activities = list_all_activities()
+    async with worker.Worker(
+        workflow_env.client,
+        task_queue=TASK_QUEUE,
+        workflows=[ResumeWorkflow],
+        activities=activities,
+        workflow_runner=SandboxedWorkflowRunner(
+            restrictions=SandboxRestrictions.default
+        ),
+    ):
+        handle = await workflow_env.client.start_workflow(
+            ResumeWorkflow.run,
+            args=[state, AgentConfig(max_revision_loops=max_revision_loops)],
+            id=state.request_id,
             task_queue=TASK_QUEUE,
-            workflows=[ResumeWorkflow],
-            activities=activities,
-            workflow_runner=SandboxedWorkflowRunner(
-                restrictions=SandboxRestrictions.default
-            ),
-        ):
-            handle = await env.client.start_workflow(
-                ResumeWorkflow.run,
-                args=[state, AgentConfig(max_revision_loops=2)],
-                id=state.request_id,
-                task_queue=TASK_QUEUE,
-            )
-            await handle.signal(ResumeWorkflow.submit_human_decision, True)
-            result = await handle.result()
-    finally:
-        await env.shutdown()
-
-    if result is None:
-        pytest.fail("Workflow did not return a result")
+        )
+        await handle.signal(ResumeWorkflow.submit_human_decision, True)
+        result = await handle.result()
 
     assert result.status == "complete"
+    assert result.stage == "done"
     assert "published_resume" in result.artifacts
     assert result.flags.get("awaiting_human") is False
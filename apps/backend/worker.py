@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import os
+from typing import Callable, Optional
 
 from temporalio import worker
 from temporalio.client import Client
@@ -31,5 +32,16 @@ async def main() -> None:
         await asyncio.Future()
 
 
+def _loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Prefer uvloop when it is installed; otherwise use the stdlib event loop."""
+
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    factory: Callable[[], asyncio.AbstractEventLoop] = uvloop.new_event_loop
+    return factory
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(), loop_factory=_loop_factory())
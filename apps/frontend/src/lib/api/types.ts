@@ -113,6 +113,15 @@ export interface components {
              */
             status: string;
         };
+        /** PipelineErrorResponse */
+        PipelineErrorResponse: {
+            /** Detail */
+            detail: string;
+            /** Workflow Id */
+            workflow_id: string;
+            /** Failed Activity */
+            failed_activity?: string | null;
+        };
         /**
          * ResumeMessage
          * @description Normalized chat message stored inside the workflow state.
@@ -352,6 +361,15 @@ export interface operations {
                     "application/json": components["schemas"]["WorkflowResultResponse"];
                 };
             };
+            /** @description Internal Server Error */
+            500: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["PipelineErrorResponse"];
+                };
+            };
             /** @description Validation Error */
             422: {
                 headers: {